@@ -74,7 +74,9 @@ if platform.system() == "Darwin":
     os.environ.setdefault("PYTORCH_MPS_HIGH_WATERMARK_RATIO", "0.0")
     os.environ.setdefault("PYTORCH_MPS_LOW_WATERMARK_RATIO", "0.0")
 else:
-    os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "backend:cudaMallocAsync")
+    # Memory history tracing (SEEDVR2_MEM_TRACE=1) needs the native allocator
+    if os.environ.get("SEEDVR2_MEM_TRACE") != "1":
+        os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "backend:cudaMallocAsync")
 
     # Pre-parse arguments that must be handled before torch import
     _pre_parser = argparse.ArgumentParser(add_help=False)
@@ -131,7 +133,7 @@ from src.core.generation_phases import (
     postprocess_all_batches
 )
 from src.utils.debug import Debug
-from src.optimization.memory_manager import clear_memory, get_gpu_backend, is_cuda_available
+from src.optimization.memory_manager import clear_memory, get_gpu_backend, is_cuda_available, log_startup_vram, enable_memory_history
 debug = Debug(enabled=False)  # Will be enabled via --debug CLI flag
 
 
@@ -981,6 +983,7 @@ def save_frames_to_image(
 # Core Processing Logic
 # =============================================================================
 
+@torch.inference_mode()
 def _process_frames_core(
     frames_tensor: torch.Tensor,
     args: argparse.Namespace,
@@ -1696,7 +1699,9 @@ def main() -> None:
     # Update debug instance with --debug flag
     debug.enabled = args.debug
 
-    # print header
+    # Initial VRAM check and header
+    log_startup_vram()
+    enable_memory_history()
     debug.print_header(cli=True)
     
     debug.log("Arguments:", category="setup")
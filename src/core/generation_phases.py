@@ -72,7 +72,10 @@ def _prepare_video_batch(
     end_idx: int,
     uniform_padding: int = 0,
     debug: Optional['Debug'] = None,
-    log_info: bool = False
+    log_info: bool = False,
+    device: Optional[torch.device] = None,
+    dtype: Optional[torch.dtype] = None,
+    tensor_name: str = "video_batch"
 ) -> torch.Tensor:
     """
     Extract and prepare video batch with uniform padding and permutation.
@@ -84,6 +87,10 @@ def _prepare_video_batch(
         uniform_padding: Number of frames to pad (0 = no padding)
         debug: Debug instance for optional logging
         log_info: If True, log padding operations (used during encoding only)
+        device: Optional target device - the contiguous slice is transferred before
+                padding and permutation so both run on the target device
+        dtype: Optional target dtype (used with device)
+        tensor_name: Name for transfer logging
         
     Returns:
         Prepared video in TCHW format
@@ -91,6 +98,20 @@ def _prepare_video_batch(
     # Extract frames (view/slice, not copy)
     video = images[start_idx:end_idx]
     
+    # Transfer the contiguous slice first: a dense copy is the fastest H2D path,
+    # and pinned sources can be copied asynchronously
+    if device is not None:
+        video = manage_tensor(
+            tensor=video,
+            target_device=device,
+            tensor_name=tensor_name,
+            dtype=dtype,
+            non_blocking=video.is_pinned(),
+            debug=debug,
+            reason="VAE encoding",
+            indent_level=1
+        )
+    
     # Apply uniform padding if needed
     if uniform_padding > 0:
         if log_info and debug:
@@ -277,13 +298,9 @@ def encode_all_batches(
     # Store actual temporal overlap used (may differ from parameter if reset)
     ctx['actual_temporal_overlap'] = temporal_overlap
     
-    # Calculate number of batches
-    num_encode_batches = 0
-    for idx in range(0, total_frames, step):
-        end_idx = min(idx + batch_size, total_frames)
-        if idx > 0 and end_idx - idx <= temporal_overlap:
-            break
-        num_encode_batches += 1
+    # Calculate number of batches: the first batch, plus every later batch start
+    # that still has more than temporal_overlap new frames (closed form)
+    num_encode_batches = 1 + max(0, (total_frames - temporal_overlap - 1) // step)
     
     # Pre-allocate lists for memory efficiency
     ctx['all_latents'] = [None] * num_encode_batches
@@ -372,20 +389,13 @@ def encode_all_batches(
                 end_idx=end_idx,
                 uniform_padding=batch_size - current_frames if is_uniform_padding else 0,
                 debug=debug,
-                log_info=True
+                log_info=True,
+                device=ctx['vae_device'],
+                dtype=ctx['compute_dtype'],
+                tensor_name=f"video_batch_{encode_idx+1}"
             )
             if is_uniform_padding:
                 current_frames = batch_size
-            
-            video = manage_tensor(
-                tensor=video,
-                target_device=ctx['vae_device'],
-                tensor_name=f"video_batch_{encode_idx+1}",
-                dtype=ctx['compute_dtype'],
-                debug=debug,
-                reason="VAE encoding",
-                indent_level=1
-            )
 
             # Check temporal dimension for 4n+1 padding
             t = video.size(0)
@@ -651,6 +661,28 @@ def upscale_all_batches(
 
         debug.log_memory_state("After DiT loading for upscaling", detailed_tensors=False)
 
+        # Noise buffers shared across batches
+        base_noise = aug_noise = None
+
+        # CUDA -> CPU offload: stage each upscaled latent through one reusable pinned buffer
+        # so the device-to-host copy is asynchronous and overlaps the next batch. The stored
+        # latents themselves stay pageable (no pinned allocation per batch)
+        async_offload = (ctx['tensor_offload_device'] is not None
+                         and ctx['tensor_offload_device'].type == 'cpu'
+                         and ctx['dit_device'].type == 'cuda')
+        staging = None
+        pending = None  # (event, upscale_idx) of the latent still in staging
+        
+        def flush_pending() -> None:
+            """Wait for the staged latent to land and store a pageable copy of it."""
+            nonlocal pending
+            if pending is None:
+                return
+            event, idx = pending
+            event.synchronize()
+            ctx['all_upscaled_latents'][idx] = torch.empty(staging.shape, dtype=staging.dtype).copy_(staging)
+            pending = None
+        
         for batch_idx, latent in enumerate(ctx['all_latents']):
             if latent is None:
                 continue
@@ -676,11 +708,16 @@ def upscale_all_batches(
                 indent_level=1
             )
 
-            # Generate noise (randn_like automatically uses latent's device)
-            base_noise = torch.randn_like(latent, dtype=ctx['compute_dtype'])
+            # Generate noise directly on the DiT device in compute dtype, reusing the
+            # buffers across batches (shape only changes for a shorter final batch)
+            if base_noise is None or base_noise.shape != latent.shape:
+                base_noise = torch.empty(latent.shape, device=latent.device, dtype=ctx['compute_dtype'])
+                aug_noise = torch.empty_like(base_noise) if latent_noise_scale > 0 else None
+            base_noise.normal_()
             
-            noises = [base_noise]
-            aug_noises = [base_noise * 0.1 + torch.randn_like(base_noise) * 0.05]
+            # Augmentation noise: base * 0.1 + randn * 0.05, only needed when latent noise is applied
+            if aug_noise is not None:
+                aug_noise.normal_().mul_(0.05).add_(base_noise, alpha=0.1)
             
             # Log latent noise application if enabled
             if latent_noise_scale > 0:
@@ -698,11 +735,10 @@ def upscale_all_batches(
             
             # Generate condition
             condition = runner.get_condition(
-                noises[0],
+                base_noise,
                 task="sr",
-                latent_blur=_add_noise(latent, aug_noises[0]),
+                latent_blur=_add_noise(latent, aug_noise),
             )
-            conditions = [condition]
             
             # Detect DiT model dtype (handle CompatibleDiT wrapper)
             dit_model = runner.dit.dit_model if hasattr(runner.dit, 'dit_model') else runner.dit
@@ -714,24 +750,49 @@ def upscale_all_batches(
             # Use autocast if DiT dtype differs from compute dtype
             # Skip autocast on MPS (CompatibleDiT already handles dtype conversion)
             debug.start_timer(f"dit_inference_{upscale_idx+1}")
-            with torch.no_grad():
-                if dit_dtype != ctx['compute_dtype'] and ctx['dit_device'].type != 'mps':
-                    with torch.autocast(ctx['dit_device'].type, ctx['compute_dtype'], enabled=True):
-                        upscaled_latents = runner.inference(
-                            noises=noises,
-                            conditions=conditions,
-                            **ctx['text_embeds'],
-                        )
-                else:
+            # The wall-clock timer only sees kernel launches: measure GPU execution with
+            # CUDA events when debugging (the wait below only happens in debug mode)
+            gpu_timing = debug.enabled and ctx['dit_device'].type == 'cuda'
+            if gpu_timing:
+                dit_stream = torch.cuda.current_stream(ctx['dit_device'])
+                dit_start = torch.cuda.Event(enable_timing=True)
+                dit_end = torch.cuda.Event(enable_timing=True)
+                dit_start.record(dit_stream)
+            if dit_dtype != ctx['compute_dtype'] and ctx['dit_device'].type != 'mps':
+                with torch.autocast(ctx['dit_device'].type, ctx['compute_dtype'], enabled=True):
                     upscaled_latents = runner.inference(
-                        noises=noises,
-                        conditions=conditions,
+                        noises=[base_noise],
+                        conditions=[condition],
                         **ctx['text_embeds'],
                     )
+            else:
+                upscaled_latents = runner.inference(
+                    noises=[base_noise],
+                    conditions=[condition],
+                    **ctx['text_embeds'],
+                )
             debug.end_timer(f"dit_inference_{upscale_idx+1}", f"DiT inference {upscale_idx+1}")
+            if gpu_timing:
+                dit_end.record(dit_stream)
+                dit_end.synchronize()
+                debug.log(f"DiT GPU time {upscale_idx+1}: {dit_start.elapsed_time(dit_end) / 1000:.2f}s",
+                          category="timing", indent_level=1)
             
             # Offload upscaled latents to avoid VRAM accumulation
-            if ctx['tensor_offload_device'] is not None and (upscaled_latents[0].is_cuda or upscaled_latents[0].is_mps):
+            if async_offload:
+                # Previous latent must leave the staging buffer before it is reused
+                flush_pending()
+                upscaled = upscaled_latents[0]
+                if staging is None or staging.shape != upscaled.shape or staging.dtype != upscaled.dtype:
+                    staging = torch.empty(upscaled.shape, dtype=upscaled.dtype, pin_memory=True)
+                staging.copy_(upscaled, non_blocking=True)
+                event = torch.cuda.Event()
+                event.record(torch.cuda.current_stream(ctx['dit_device']))
+                pending = (event, upscale_idx)
+                debug.log(f"Staging upscaled_latent_{upscale_idx+1} for CPU offload (async)", 
+                          category="memory", indent_level=1)
+                del upscaled
+            elif ctx['tensor_offload_device'] is not None and (upscaled_latents[0].is_cuda or upscaled_latents[0].is_mps):
                 ctx['all_upscaled_latents'][upscale_idx] = manage_tensor(
                     tensor=upscaled_latents[0],
                     target_device=ctx['tensor_offload_device'],
@@ -747,7 +808,7 @@ def upscale_all_batches(
             release_tensor_memory(ctx['all_latents'][batch_idx])
             ctx['all_latents'][batch_idx] = None
             
-            del noises, aug_noises, latent, conditions, condition, base_noise, upscaled_latents
+            del latent, condition, upscaled_latents
             
             debug.end_timer(f"upscale_batch_{upscale_idx+1}", f"Upscaled batch {upscale_idx+1}")
             
@@ -756,6 +817,12 @@ def upscale_all_batches(
                                 1, "Phase 2: Upscaling")
             
             upscale_idx += 1
+        
+        del base_noise, aug_noise
+
+        # Offloaded latents must be complete before DiT cleanup and decode
+        flush_pending()
+        staging = None
             
     except Exception as e:
         debug.log(f"Error in Phase 2 (Upscaling): {e}", level="ERROR", category="error", force=True)
@@ -878,6 +945,27 @@ def decode_all_batches(
     
     ctx['final_video'] = torch.empty((total_frames, true_h, true_w, C), dtype=ctx['compute_dtype'], device=target_device)
     
+    # Decoding on CUDA into host memory: stage each batch through one small reusable pinned
+    # buffer so the device-to-host copy is asynchronous. final_video itself stays pageable,
+    # pinning the whole video would lock (and keep cached) many GB of host RAM
+    use_pinned = torch.device(target_device).type == 'cpu' and ctx['vae_device'].type == 'cuda'
+    staging = None
+    pending = None  # (event, frames, write_start, write_end) of the batch still in staging
+    
+    def flush_pending() -> None:
+        """Wait for the staged batch to land and copy it into final_video."""
+        nonlocal pending
+        if pending is None:
+            return
+        event, frames, start, end = pending
+        event.synchronize()
+        # For RGBA, write only RGB channels (VAE outputs 3 channels)
+        if C == 4:
+            ctx['final_video'][start:end, :, :, :3].copy_(staging[:frames])
+        else:
+            ctx['final_video'][start:end].copy_(staging[:frames])
+        pending = None
+    
     # Track batch write positions for Phase 4 processing
     # Each entry: (write_start, write_end, batch_idx, ori_length)
     ctx['decode_batch_info'] = []
@@ -977,6 +1065,9 @@ def decode_all_batches(
             else:
                 # Subsequent batches with overlap: blend overlapping region
                 if temporal_overlap < batch_frames and current_write_idx >= temporal_overlap:
+                    # The previous batch must land in final_video before its tail is blended
+                    flush_pending()
+                    
                     # Blend overlapping region in-place on final_video
                     prev_tail = ctx['final_video'][current_write_idx - temporal_overlap:current_write_idx]
                     cur_head = sample[:temporal_overlap]
@@ -999,22 +1090,30 @@ def decode_all_batches(
                 write_start = current_write_idx
                 write_end = current_write_idx + batch_frames
             
-            # Move sample to target device and write directly to final_video
-            sample = manage_tensor(
-                tensor=sample,
-                target_device=target_device,
-                tensor_name=f"sample_{decode_idx+1}",
-                dtype=ctx['compute_dtype'],
-                debug=debug,
-                reason="writing to final_video",
-                indent_level=1
-            )
-            
-            # Write to final_video - for RGBA, write only RGB channels (VAE outputs 3 channels)
-            if ctx.get('is_rgba', False):
-                ctx['final_video'][write_start:write_end, :, :, :3] = sample
+            if use_pinned:
+                # Async copy into the pinned staging buffer; it is flushed into final_video
+                # once the next batch has been queued for decoding (or after the loop)
+                flush_pending()
+                if staging is None or staging.shape[0] < batch_frames or staging.shape[1:] != sample.shape[1:]:
+                    staging = None
+                    try:
+                        staging = torch.empty(sample.shape, dtype=ctx['final_video'].dtype, pin_memory=True)
+                    except RuntimeError as e:
+                        debug.log(f"Could not pin staging buffer, using synchronous write-back: {e}", 
+                                  level="WARNING", category="memory", force=True)
+                        use_pinned = False
+            if use_pinned:
+                staging[:batch_frames].copy_(sample, non_blocking=True)
+                event = torch.cuda.Event()
+                event.record(torch.cuda.current_stream(ctx['vae_device']))
+                pending = (event, batch_frames, write_start, write_end)
+            # Write directly into final_video - copy_ handles device and dtype in one
+            # transfer, avoiding an intermediate tensor on the target device.
+            # For RGBA, write only RGB channels (VAE outputs 3 channels)
+            elif ctx.get('is_rgba', False):
+                ctx['final_video'][write_start:write_end, :, :, :3].copy_(sample)
             else:
-                ctx['final_video'][write_start:write_end] = sample
+                ctx['final_video'][write_start:write_end].copy_(sample)
             
             # Store batch info for Phase 4 processing
             ctx['decode_batch_info'].append((write_start, write_end, decode_idx, ori_length))
@@ -1036,6 +1135,10 @@ def decode_all_batches(
             
             decode_idx += 1
         
+        # Land the last staged batch before final_video leaves this phase
+        flush_pending()
+        staging = None
+        
         # Store padding stats for Phase 4 final summary
         ctx['total_padding_removed'] = total_padding_removed
             
@@ -1334,15 +1437,9 @@ def postprocess_all_batches(
             
             # Apply normalization only to RGB channels, preserve Alpha as-is
             if ctx.get('is_rgba', False) and sample.shape[-1] == 4:
-                # Split RGBA: sample is (T, H, W, C) format after optimized_sample_to_image_format
-                rgb_channels = sample[..., :3]  # (T, H, W, 3)
-                alpha_channel = sample[..., 3:4]  # (T, H, W, 1)
-                
-                # Normalize only RGB from [-1, 1] to [0, 1]
-                rgb_channels.clamp_(-1, 1).mul_(0.5).add_(0.5)
-                
-                # Merge back with unchanged Alpha
-                sample = torch.cat([rgb_channels, alpha_channel], dim=-1)
+                # Normalize only RGB from [-1, 1] to [0, 1] - in-place on the view,
+                # so sample is updated without re-concatenating the alpha channel
+                sample[..., :3].clamp_(-1, 1).mul_(0.5).add_(0.5)
             else:
                 # RGB only: apply normalization as usual
                 sample.clamp_(-1, 1).mul_(0.5).add_(0.5)
@@ -1354,23 +1451,19 @@ def postprocess_all_batches(
                     sample = _draw_tile_boundaries(sample, debug, tiles, phase)
                     break
             
-            # Move to final_video device and write back in-place
-            sample = manage_tensor(
-                tensor=sample,
-                target_device=ctx['final_video'].device,
-                tensor_name=f"sample_{info_idx+1}_final",
-                dtype=ctx['compute_dtype'],
-                debug=debug,
-                reason="writing processed result to final_video",
-                indent_level=1
-            )
-            
-            # Write back to final_video in-place
+            # Write back to final_video in-place - copy_ handles device and dtype in one transfer
             # For RGBA, write only RGB channels (alpha already written during alpha processing)
             if ctx.get('is_rgba', False) and ctx['final_video'].shape[-1] == 4:
-                ctx['final_video'][write_start:write_end, :, :, :3] = sample
+                destination = ctx['final_video'][write_start:write_end, :, :, :3]
+                sample = sample[..., :3]
             else:
-                ctx['final_video'][write_start:write_end] = sample
+                destination = ctx['final_video'][write_start:write_end]
+            
+            # Skip the copy when sample is still a view of the destination (processed in-place)
+            if not (sample.data_ptr() == destination.data_ptr() and sample.stride() == destination.stride()
+                    and sample.device == destination.device):
+                destination.copy_(sample)
+            del destination
             
             # Free sample memory
             del sample, sample_thwc
@@ -28,9 +28,10 @@ These utilities support the 4-phase pipeline implemented in generation_phases.py
 """
 
 import os
+import functools
 import torch
 from typing import Dict, List, Optional, Tuple, Any, Callable, Union
-from torchvision.transforms import Compose, Lambda, Normalize
+from torchvision.transforms import Compose, Lambda
 
 from .model_configuration import configure_runner
 from .infer import VideoDiffusionInfer
@@ -77,13 +78,23 @@ def prepare_video_transforms(resolution: int, max_resolution: int = 0, debug: Op
             downsample_only=False,
             max_resolution=max_resolution,
         ),
-        Lambda(lambda x: torch.clamp(x, 0.0, 1.0)),
         DivisiblePad((16, 16)),
-        Normalize(0.5, 0.5),
-        Lambda(lambda x: x.permute(1, 0, 2, 3)),  # t c h w -> c t h w (faster than Rearrange)
+        _clamp_normalize_permute,
     ])
 
 
+def _clamp_normalize_permute(video: torch.Tensor) -> torch.Tensor:
+    """
+    Clamp to [0, 1], normalize to [-1, 1] and permute t c h w -> c t h w.
+    
+    Replaces separate clamp/Normalize/permute stages with one out-of-place pass
+    followed by in-place ops. Clamping after DivisiblePad is equivalent since the
+    padding value (0) is already in range.
+    """
+    # First op must be out-of-place: resize/pad may return the caller's tensor unchanged
+    return video.clamp(0.0, 1.0).mul_(2.0).sub_(1.0).permute(1, 0, 2, 3)
+
+
 def setup_video_transform(ctx: Dict[str, Any], resolution: int, max_resolution: int = 0, 
                          debug: Optional['Debug'] = None, 
                          sample_frame: Optional[torch.Tensor] = None) -> Tuple[int, int, int, int]:
@@ -514,6 +525,17 @@ def prepare_runner(
     return runner, cache_context
 
 
+@functools.lru_cache(maxsize=4)
+def _load_embedding_file(path: str) -> torch.Tensor:
+    """
+    Load a text embedding file from disk once per process.
+    
+    Returns the CPU tensor as stored on disk. Callers must never modify or
+    release it in place, since the same object is returned on every call.
+    """
+    return torch.load(path, map_location='cpu', mmap=True, weights_only=True)
+
+
 def load_text_embeddings(script_directory: str, device: torch.device, 
                         dtype: torch.dtype, debug: Optional['Debug'] = None) -> Dict[str, List[torch.Tensor]]:
     """
@@ -534,11 +556,12 @@ def load_text_embeddings(script_directory: str, device: torch.device,
         - Memory-efficient embedding preparation
         - Consistent movement logging
     """
-    text_pos_embeds = torch.load(os.path.join(script_directory, 'pos_emb.pt'), weights_only=True)
-    text_neg_embeds = torch.load(os.path.join(script_directory, 'neg_emb.pt'), weights_only=True)
+    # Disk reads are cached; the cached CPU tensors are only ever copied from
+    cached_pos = _load_embedding_file(os.path.join(script_directory, 'pos_emb.pt'))
+    cached_neg = _load_embedding_file(os.path.join(script_directory, 'neg_emb.pt'))
     
     text_pos_embeds = manage_tensor(
-        tensor=text_pos_embeds,
+        tensor=cached_pos,
         target_device=device,
         tensor_name="text_pos_embeds",
         dtype=dtype,
@@ -546,7 +569,7 @@ def load_text_embeddings(script_directory: str, device: torch.device,
         reason="DiT inference"
     )
     text_neg_embeds = manage_tensor(
-        tensor=text_neg_embeds,
+        tensor=cached_neg,
         target_device=device,
         tensor_name="text_neg_embeds",
         dtype=dtype,
@@ -554,6 +577,12 @@ def load_text_embeddings(script_directory: str, device: torch.device,
         reason="DiT inference"
     )
     
+    # Embeddings are released in place after generation - never hand out the cached tensors
+    if text_pos_embeds is cached_pos:
+        text_pos_embeds = text_pos_embeds.clone()
+    if text_neg_embeds is cached_neg:
+        text_neg_embeds = text_neg_embeds.clone()
+    
     return {"texts_pos": [text_pos_embeds], "texts_neg": [text_neg_embeds]}
 
 
@@ -582,11 +611,8 @@ def calculate_optimal_batch_params(total_frames: int, batch_size: int,
         step = batch_size
         temporal_overlap = 0
     
-    # Find all valid 4n+1 batch sizes up to total_frames
-    valid_sizes = [i for i in range(1, total_frames + 1) if i % 4 == 1]
-    
-    # Best batch: largest valid size ≤ total_frames (maximizes temporal stability)
-    best_batch = max(valid_sizes) if valid_sizes else 1
+    # Best batch: largest 4n+1 size ≤ total_frames (maximizes temporal stability)
+    best_batch = total_frames - ((total_frames - 1) % 4) if total_frames >= 1 else 1
     
     return {
         'step': step,
@@ -636,12 +662,13 @@ def pad_video_temporal(videos: torch.Tensor, count: int = 0, temporal_dim: int =
         repeat_count = count - t + 1
         last = select(-1, None)
         
-        # Repeat last frame
+        # Repeat last frame as a broadcast view - torch.cat materializes it
+        # directly into the output, so no intermediate copy is needed
         if temporal_dim == 0:
-            repeated = last.repeat(repeat_count, 1, 1, 1)
+            repeated = last.expand(repeat_count, -1, -1, -1)
             reversed_frames = select(1, None).flip(temporal_dim) if t > 1 else last[:0]
         else:
-            repeated = last.expand(-1, repeat_count, -1, -1).contiguous()
+            repeated = last.expand(-1, repeat_count, -1, -1)
             reversed_frames = select(1, None).flip(temporal_dim) if t > 1 else last[:, :0]
         
         return torch.cat([repeated, reversed_frames, videos] if prepend else 
@@ -14,7 +14,6 @@
 
 from typing import List, Optional, Tuple, Union
 import torch
-from einops import rearrange
 from omegaconf import DictConfig, ListConfig
 from torch import Tensor
 from ..common.diffusion import (
@@ -33,6 +32,17 @@ from ..optimization.performance import (
 from ..models.dit_3b import na
 
 
+def _lin_coefficients(x1: float, y1: float, x2: float, y2: float) -> Tuple[float, float]:
+    """Slope and intercept of the line through (x1, y1) and (x2, y2)."""
+    m = (y2 - y1) / (x2 - x1)
+    return m, y1 - m * x1
+
+
+# Resolution-dependent timestep shift: pixel area (image) or area * frames (video)
+_IMG_SHIFT_M, _IMG_SHIFT_B = _lin_coefficients(x1=256 * 256, y1=1.0, x2=1024 * 1024, y2=3.2)
+_VID_SHIFT_M, _VID_SHIFT_B = _lin_coefficients(x1=256 * 256 * 37, y1=1.0, x2=1280 * 720 * 145, y2=5.0)
+
+
 class VideoDiffusionInfer():
     def __init__(self, config: DictConfig, debug: 'Debug',
                  encode_tiled: bool = False, encode_tile_size: Tuple[int, int] = (512, 512), 
@@ -50,15 +60,20 @@ class VideoDiffusionInfer():
         self.decode_tile_size = decode_tile_size
         self.decode_tile_overlap = decode_tile_overlap
         self.tile_debug = tile_debug
+        # Per-device latent scale/shift, see _get_vae_scaling
+        self._vae_scaling_cache = {}
         
     def get_condition(self, latent: Tensor, latent_blur: Tensor, task: str) -> Tensor:
         t, h, w, c = latent.shape
+        if task == "sr":
+            # sr generation - every element is written, so skip zero-initialization.
+            cond = torch.empty([t, h, w, c + 1], device=latent.device, dtype=latent.dtype)
+            cond[..., :-1].copy_(latent_blur)
+            cond[..., -1:].fill_(1.0)
+            return cond
         cond = torch.zeros([t, h, w, c + 1], device=latent.device, dtype=latent.dtype)
         if task == "t2v" or t == 1:
             # t2i or t2v generation.
-            if task == "sr":
-                cond[:, ..., :-1] = latent_blur[:]
-                cond[:, ..., -1:] = 1.0
             return cond
         if task == "i2v":
             # i2v generation.
@@ -70,11 +85,6 @@ class VideoDiffusionInfer():
             cond[:2, ..., :-1] = latent[:2]
             cond[:2, ..., -1:] = 1.0
             return cond
-        if task == "sr":
-            # sr generation.
-            cond[:, ..., :-1] = latent_blur[:]
-            cond[:, ..., -1:] = 1.0
-            return cond
         raise NotImplementedError
     
     def configure_diffusion(self, device: Optional[torch.device] = None, dtype=torch.float32):
@@ -113,46 +123,77 @@ class VideoDiffusionInfer():
 
     # -------------------------------- Helper ------------------------------- #
 
-    @torch.no_grad()
+    def _get_vae_scaling(self, device: torch.device) -> Tuple[Union[float, Tensor], ...]:
+        """
+        Get VAE latent affine coefficients for the given device.
+        
+        Both directions are folded into a single multiply-add:
+            encode: (x - shift) * scale = x * scale + (-shift * scale)
+            decode: x / scale + shift   = x * (1 / scale) + shift
+        Scalar factors stay Python floats so no precision is lost to the compute dtype.
+        Per-channel factors (ListConfig) become fp32 channel-last tensors, created once
+        per device to avoid a host-to-device copy on every encode/decode call.
+        
+        Returns:
+            Tuple of (scale, encode_bias, inv_scale, shift)
+        """
+        cached = self._vae_scaling_cache.get(device)
+        if cached is None:
+            scale = self.config.vae.scaling_factor
+            shift = self.config.vae.get("shifting_factor", 0.0)
+            if isinstance(scale, ListConfig) or isinstance(shift, ListConfig):
+                def as_tensor(value):
+                    value = list(value) if isinstance(value, ListConfig) else float(value)
+                    return torch.tensor(value, dtype=torch.float64)
+                scale, shift = as_tensor(scale), as_tensor(shift)
+                coefficients = (scale, -shift * scale, scale.reciprocal(), shift)
+                # Cast on CPU first: float64 is not supported on every backend (e.g. MPS)
+                cached = tuple(c.to(dtype=torch.float32).to(device) for c in coefficients)
+            else:
+                scale, shift = float(scale), float(shift)
+                cached = (scale, -shift * scale, 1.0 / scale, shift)
+            self._vae_scaling_cache[device] = cached
+        return cached
+
+    @staticmethod
+    def _apply_vae_affine(latent: Tensor, mul: Union[float, Tensor], add: Union[float, Tensor]) -> Tensor:
+        """Compute latent * mul + add, keeping the latent dtype."""
+        if isinstance(mul, Tensor):
+            # Per-channel fp32 factors: compute in fp32, then cast back
+            return torch.addcmul(add, latent.float(), mul).to(latent.dtype)
+        latent = latent.mul(mul)
+        return latent.add_(add) if add != 0.0 else latent
+
+    @torch.inference_mode()
     def vae_encode(self, samples: List[Tensor]) -> List[Tensor]:
         """VAE encode with configured dtype - converts samples to latents with optional tiling"""
         use_sample = self.config.vae.get("use_sample", True)
         latents = []
         if len(samples) > 0:
-            # Use VAE model's current device
+            # Use VAE model's current device and dtype, read from a single parameter
             # This ensures consistency with where the VAE model is loaded
             try:
-                device = next(self.vae.parameters()).device
+                vae_param = next(self.vae.parameters())
+                device, vae_dtype = vae_param.device, vae_param.dtype
             except StopIteration:
-                # Fallback if VAE has no parameters (shouldn't happen)
-                device = get_device()
+                # Fallback if VAE has no parameters (shouldn't happen): configured dtype
+                device, vae_dtype = get_device(), getattr(torch, self.config.vae.dtype)
             
-            dtype = getattr(torch, self.config.vae.dtype)
-            scale = self.config.vae.scaling_factor
-            shift = self.config.vae.get("shifting_factor", 0.0)
-
-            if isinstance(scale, ListConfig):
-                scale = torch.tensor(scale, device=device, dtype=dtype)
-            if isinstance(shift, ListConfig):
-                shift = torch.tensor(shift, device=device, dtype=dtype)
+            scale, encode_bias, _, _ = self._get_vae_scaling(device)
 
             # Group samples of the same shape to batches if enabled.
-            if self.config.vae.grouping:
+            grouping = self.config.vae.grouping
+            if grouping:
                 batches, indices = na.pack(samples)
             else:
-                batches = [sample.unsqueeze(0) for sample in samples]
+                # One sample per batch: add the batch dim lazily instead of building a second list
+                batches = (sample.unsqueeze(0) for sample in samples)
 
             # VAE process by each group.
             for sample in batches:
                 if hasattr(self.vae, "preprocess"):
                     sample = self.vae.preprocess(sample)
 
-                # Detect VAE model dtype
-                try:
-                    vae_dtype = next(self.vae.parameters()).dtype
-                except StopIteration:
-                    vae_dtype = dtype  # Fallback
-
                 # Use autocast if VAE dtype differs from input dtype
                 # Skip autocast on MPS (only supports bf16, unified memory = no benefit)
                 # Instead, explicitly convert input to model dtype
@@ -185,11 +226,12 @@ class VideoDiffusionInfer():
 
                 latent = latent.unsqueeze(2) if latent.ndim == 4 else latent
                 latent = optimized_channels_to_last(latent)
-                latent = (latent - shift) * scale
+                # (latent - shift) * scale as a single multiply-add
+                latent = self._apply_vae_affine(latent, scale, encode_bias)
                 latents.append(latent)
 
             # Ungroup back to individual latent with the original order.
-            if self.config.vae.grouping:
+            if grouping:
                 latents = na.unpack(latents, indices)
             else:
                 latents = [latent.squeeze(0) for latent in latents]
@@ -199,47 +241,38 @@ class VideoDiffusionInfer():
         return latents
     
 
-    @torch.no_grad()
+    @torch.inference_mode()
     def vae_decode(self, latents: List[Tensor]) -> List[Tensor]:
         """VAE decode with configured dtype - converts latents to samples with optional tiling"""
         samples = []
         if len(latents) > 0:
-            # Use VAE model's current device
+            # Use VAE model's current device and dtype, read from a single parameter
             # This ensures consistency with where the VAE model is loaded
             try:
-                device = next(self.vae.parameters()).device
+                vae_param = next(self.vae.parameters())
+                device, vae_dtype = vae_param.device, vae_param.dtype
             except StopIteration:
-                # Fallback if VAE has no parameters (shouldn't happen)
-                device = get_device()
+                # Fallback if VAE has no parameters (shouldn't happen): configured dtype
+                device, vae_dtype = get_device(), getattr(torch, self.config.vae.dtype)
             
-            dtype = getattr(torch, self.config.vae.dtype)
-            scale = self.config.vae.scaling_factor
-            shift = self.config.vae.get("shifting_factor", 0.0)
+            _, _, inv_scale, shift = self._get_vae_scaling(device)
 
-            if isinstance(scale, ListConfig):
-                scale = torch.tensor(scale, device=device, dtype=dtype)
-            if isinstance(shift, ListConfig):
-                shift = torch.tensor(shift, device=device, dtype=dtype)
+            self.debug.log(f"Latents shape: {latents[0].shape}", category="info", indent_level=1)
 
             # Group samples of the same shape to batches if enabled.
-            if self.config.vae.grouping:
+            grouping = self.config.vae.grouping
+            if grouping:
                 latents, indices = na.pack(latents)
             else:
-                latents = [latent.unsqueeze(0) for latent in latents]
-
-            self.debug.log(f"Latents shape: {latents[0].shape}", category="info", indent_level=1)
+                # One latent per batch: add the batch dim lazily instead of building a second list
+                latents = (latent.unsqueeze(0) for latent in latents)
 
-            for i, latent in enumerate(latents):
-                latent = latent / scale + shift
+            for latent in latents:
+                # latent / scale + shift as a single multiply-add
+                latent = self._apply_vae_affine(latent, inv_scale, shift)
                 latent = optimized_channels_to_second(latent)
                 latent = latent.squeeze(2)
 
-                # Detect VAE model dtype
-                try:
-                    vae_dtype = next(self.vae.parameters()).dtype
-                except StopIteration:
-                    vae_dtype = dtype  # Fallback
-
                 # Use autocast if VAE dtype differs from latent dtype
                 # Skip autocast on MPS (only supports bf16, unified memory = no benefit)
                 if vae_dtype != latent.dtype:
@@ -270,7 +303,7 @@ class VideoDiffusionInfer():
 
                 samples.append(sample)
 
-            if self.config.vae.grouping:
+            if grouping:
                 samples = na.unpack(samples, indices)
             else:
                 samples = [sample.squeeze(0) for sample in samples]
@@ -291,27 +324,20 @@ class VideoDiffusionInfer():
         widths = latents_shapes[:, 2] * vs
 
         # Compute shift factor.
-        def get_lin_function(x1, y1, x2, y2):
-            m = (y2 - y1) / (x2 - x1)
-            b = y1 - m * x1
-            return lambda x: m * x + b
-
-        img_shift_fn = get_lin_function(x1=256 * 256, y1=1.0, x2=1024 * 1024, y2=3.2)
-        vid_shift_fn = get_lin_function(x1=256 * 256 * 37, y1=1.0, x2=1280 * 720 * 145, y2=5.0)
+        area = heights * widths
         shift = torch.where(
             frames > 1,
-            vid_shift_fn(heights * widths * frames),
-            img_shift_fn(heights * widths),
+            area * frames * _VID_SHIFT_M + _VID_SHIFT_B,
+            area * _IMG_SHIFT_M + _IMG_SHIFT_B,
         )
 
-        # Shift timesteps.
-        timesteps = timesteps / self.schedule.T
-        timesteps = shift * timesteps / (1 + (shift - 1) * timesteps)
-        timesteps = timesteps * self.schedule.T
-        return timesteps
+        # Shift timesteps: T * s*x / (1 + (s-1)*x) with x = t/T, folded to
+        # s*t / (1 + (s-1)*t/T) so only one division by T is needed.
+        T = self.schedule.T
+        return shift * timesteps / ((shift - 1) * timesteps / T + 1)
 
 
-    @torch.no_grad()
+    @torch.inference_mode()
     def inference(
         self,
         noises: List[Tensor],
@@ -355,37 +381,54 @@ class VideoDiffusionInfer():
         latents, latents_shapes = na.flatten(noises)
         latents_cond, _ = na.flatten(conditions)
         
-        latents = self.sampler.sample(
-            x=latents,
-            f=lambda args: classifier_free_guidance_dispatcher(
+        # Resolve config once - the guidance lambda runs on every sampling step
+        cfg_partial = self.config.diffusion.cfg.get("partial", 1)
+        cfg_rescale = self.config.diffusion.cfg.rescale
+        num_timesteps = len(self.sampler.timesteps)
+        
+        # Channel-concatenated DiT input: the condition is static across steps, so it is
+        # written once and only the x_t channels are refreshed per step
+        latent_channels = latents.shape[-1]
+        vid = latents.new_empty(
+            (*latents.shape[:-1], latent_channels + latents_cond.shape[-1]),
+            dtype=torch.promote_types(latents.dtype, latents_cond.dtype),
+        )
+        vid[..., latent_channels:].copy_(latents_cond)
+        del latents_cond
+
+        def guided_prediction(args):
+            # DiT inputs are shared by the positive and negative passes - build them once per step
+            vid[..., :latent_channels].copy_(args.x_t)
+            timestep = args.t.repeat(batch_size)
+            return classifier_free_guidance_dispatcher(
                 pos=lambda: self.dit(
-                    vid=torch.cat([args.x_t, latents_cond], dim=-1),
+                    vid=vid,
                     txt=text_pos_embeds,
                     vid_shape=latents_shapes,
                     txt_shape=text_pos_shapes,
-                    timestep=args.t.repeat(batch_size),
+                    timestep=timestep,
                 ).vid_sample,
                 neg=lambda: self.dit(
-                    vid=torch.cat([args.x_t, latents_cond], dim=-1),
+                    vid=vid,
                     txt=text_neg_embeds,
                     vid_shape=latents_shapes,
                     txt_shape=text_neg_shapes,
-                    timestep=args.t.repeat(batch_size),
+                    timestep=timestep,
                 ).vid_sample,
                 scale=(
                     cfg_scale
-                    if (args.i + 1) / len(self.sampler.timesteps)
-                    <= self.config.diffusion.cfg.get("partial", 1)
+                    if (args.i + 1) / num_timesteps <= cfg_partial
                     else 1.0
                 ),
-                rescale=self.config.diffusion.cfg.rescale,
-            ),
-        )
+                rescale=cfg_rescale,
+            )
+
+        latents = self.sampler.sample(x=latents, f=guided_prediction)
 
         latents = na.unflatten(latents, latents_shapes)
 
         # Clean up temporary tensors
-        del latents_cond
+        del vid
         del latents_shapes
         del text_pos_embeds
         del text_neg_embeds
@@ -9,6 +9,7 @@ from .video_upscaler import SeedVR2VideoUpscaler
 from .dit_model_loader import SeedVR2LoadDiTModel
 from .vae_model_loader import SeedVR2LoadVAEModel
 from .torch_compile_settings import SeedVR2TorchCompileSettings
+from ..optimization.memory_manager import log_startup_vram
 
 
 class SeedVR2Extension(ComfyExtension):
@@ -26,6 +27,7 @@ class SeedVR2Extension(ComfyExtension):
 
 async def comfy_entrypoint() -> ComfyExtension:
     """ComfyUI V3 entry point"""
+    log_startup_vram()
     return SeedVR2Extension()
 
 
@@ -11,7 +11,7 @@
 
 
 from contextlib import nullcontext
-from typing import Literal, Optional, Tuple, Union
+from typing import List, Literal, Optional, Tuple, Union
 import diffusers
 import torch
 import torch.nn as nn
@@ -1060,6 +1060,53 @@ class AutoencoderKL(diffusers.AutoencoderKL):
         return super().load_state_dict(state_dict, strict, assign)
 
 
+def _tile_spans(size: int, tile: int, stride: int, overlap: int) -> List[Tuple[int, int]]:
+    """
+    Compute [start, end) spans of spatial tiles along one axis.
+    
+    Tiles after the first that would lie entirely within the overlap of the
+    previous tile are dropped, so every returned span contributes new pixels.
+    """
+    spans = []
+    for start in range(0, size, stride):
+        end = min(start + tile, size)
+        if start > 0 and end - start <= overlap:
+            continue
+        spans.append((start, end))
+    return spans
+
+
+def _tile_blend_weights(cache: dict, length: int, overlap: int, ramp: Optional[torch.Tensor],
+                        fade_start: bool, fade_end: bool, like: torch.Tensor) -> torch.Tensor:
+    """
+    Get the 1-D blend weights for one tile axis, building them only on first use.
+    
+    Weights depend only on the tile length and on which edges are interior, so a
+    tile grid needs at most a handful of distinct vectors per axis.
+    
+    Args:
+        cache: Per-axis dict reused across the tiles of one tiled encode/decode call
+        length: Tile length along this axis
+        overlap: Requested overlap along this axis
+        ramp: Precomputed cosine ramp of size `overlap` (None when overlap is 0)
+        fade_start: Fade in at the start (tile is not on the leading image border)
+        fade_end: Fade out at the end (tile is not on the trailing image border)
+        like: Tensor whose device and dtype the weights should match
+    """
+    key = (length, fade_start, fade_end, like.device, like.dtype)
+    weight = cache.get(key)
+    if weight is None:
+        weight = torch.ones((length,), device=like.device, dtype=like.dtype)
+        ov = max(0, min(overlap, length - 1))
+        if ov > 0:
+            if fade_start:
+                weight[:ov] = ramp[:ov]
+            if fade_end:
+                weight[-ov:] = 1 - ramp[:ov]
+        cache[key] = weight
+    return weight
+
+
 class VideoAutoencoderKL(diffusers.AutoencoderKL):
     """
     We simply inherit the model code from diffusers
@@ -1279,17 +1326,30 @@ class VideoAutoencoderKL(diffusers.AutoencoderKL):
         sp_size = get_sequence_parallel_world_size()
         if self.use_slicing and (z.shape[2] - 1) > self.slicing_latent_min_size * sp_size:
             z_slices = z[:, :, 1:].split(split_size=self.slicing_latent_min_size * sp_size, dim=2)
-            decoded_slices = [
-                self._decode(
-                    torch.cat((z[:, :, :1], z_slices[0]), dim=2),
-                    memory_state=MemoryState.INITIALIZING
-                )
-            ]
-            for z_idx in range(1, len(z_slices)):
-                decoded_slices.append(
-                    self._decode(z_slices[z_idx], memory_state=MemoryState.ACTIVE)
+            first = self._decode(
+                torch.cat((z[:, :, :1], z_slices[0]), dim=2),
+                memory_state=MemoryState.INITIALIZING
+            )
+            
+            # Write slices straight into a pre-allocated output instead of list + cat.
+            # Causal decode: the leading latent frame yields one frame and every later latent
+            # frame yields the same number of frames - derive that count from the first slice
+            frames_per_latent = (first.shape[2] - 1) // z_slices[0].shape[2]
+            remaining = sum(z_slice.shape[2] for z_slice in z_slices[1:])
+            out = first.new_empty((*first.shape[:2], first.shape[2] + remaining * frames_per_latent, *first.shape[3:]))
+            out[:, :, :first.shape[2]].copy_(first)
+            write_idx = first.shape[2]
+            del first
+            for z_slice in z_slices[1:]:
+                decoded = self._decode(z_slice, memory_state=MemoryState.ACTIVE)
+                out[:, :, write_idx:write_idx + decoded.shape[2]].copy_(decoded)
+                write_idx += decoded.shape[2]
+                del decoded
+            if write_idx != out.shape[2]:
+                raise RuntimeError(
+                    f"slicing_decode produced {write_idx} frames, expected {out.shape[2]} "
+                    f"({frames_per_latent} frames per latent frame)"
                 )
-            out = torch.cat(decoded_slices, dim=2)
             # Clear memory efficiently
             modules_with_memory = [m for m in self.modules() 
                                 if isinstance(m, InflatedCausalConv3d) and m.memory is not None]
@@ -1340,8 +1400,9 @@ class VideoAutoencoderKL(diffusers.AutoencoderKL):
         result = None
         count = None
 
-        num_tiles = ((max(H_lat_total - latent_overlap_h, 1) + stride_h - 1) // stride_h) \
-                  * ((max(W_lat_total - latent_overlap_w, 1) + stride_w - 1) // stride_w)
+        y_spans = _tile_spans(H_lat_total, latent_tile_h, stride_h, latent_overlap_h)
+        x_spans = _tile_spans(W_lat_total, latent_tile_w, stride_w, latent_overlap_w)
+        num_tiles = len(y_spans) * len(x_spans)
 
         # Log once at start instead of per-tile
         if self.debug:
@@ -1358,18 +1419,11 @@ class VideoAutoencoderKL(diffusers.AutoencoderKL):
         if latent_overlap_w > 0:
             t_w = torch.linspace(0, 1, steps=latent_overlap_w, device=x.device, dtype=x.dtype)
             ramp_cache['w'] = 0.5 - 0.5 * torch.cos(t_w * torch.pi)
+        weight_cache = {'h': {}, 'w': {}}
 
         tile_id = 0
-        for y_lat in range(0, H_lat_total, stride_h):
-            y_lat_end = min(y_lat + latent_tile_h, H_lat_total)
-            for x_lat in range(0, W_lat_total, stride_w):
-                x_lat_end = min(x_lat + latent_tile_w, W_lat_total)
-
-                # Skip if fully within overlap of previous tiles
-                if (y_lat > 0 and (y_lat_end - y_lat) <= latent_overlap_h) or \
-                   (x_lat > 0 and (x_lat_end - x_lat) <= latent_overlap_w):
-                    continue
-
+        for y_lat, y_lat_end in y_spans:
+            for x_lat, x_lat_end in x_spans:
                 # Map latent tile to output-space crop
                 y_out = y_lat * scale_factor
                 x_out = x_lat * scale_factor
@@ -1416,51 +1470,36 @@ class VideoAutoencoderKL(diffusers.AutoencoderKL):
                         device=device,
                         dtype=encoded_tile.dtype,
                     )
-                    count = torch.zeros((1, 1, 1, H_lat_total, W_lat_total), device=device, dtype=encoded_tile.dtype)
+                    # Blend weights are tiny: keep them with the tiles so per-tile masks never cross devices
+                    count = torch.zeros((1, 1, 1, H_lat_total, W_lat_total), device=encoded_tile.device, dtype=encoded_tile.dtype)
 
                 eff_h_lat = min(y_lat_end - y_lat, encoded_tile.shape[3], result.shape[3] - y_lat)
                 eff_w_lat = min(x_lat_end - x_lat, encoded_tile.shape[4], result.shape[4] - x_lat)
 
                 encoded_tile = encoded_tile[:, :, : result.shape[2], :eff_h_lat, :eff_w_lat]
 
-                # Build faded masks
-                ov_h = max(0, min(latent_overlap_h, eff_h_lat - 1))
-                ov_w = max(0, min(latent_overlap_w, eff_w_lat - 1))
-                
-                weight_h = torch.ones((eff_h_lat,), device=encoded_tile.device, dtype=encoded_tile.dtype)
-                weight_w = torch.ones((eff_w_lat,), device=encoded_tile.device, dtype=encoded_tile.dtype)
-
-                # Apply fades only on interior edges using cached ramps (avoid fading on outer image borders)
-                if ov_h > 0:
-                    if y_lat > 0:  # Not top edge
-                        weight_h[:ov_h] = ramp_cache['h'][:ov_h]
-                    if y_lat_end < H_lat_total:  # Not bottom edge
-                        weight_h[-ov_h:] = 1 - ramp_cache['h'][:ov_h]
-                if ov_w > 0:
-                    if x_lat > 0:  # Not left edge
-                        weight_w[:ov_w] = ramp_cache['w'][:ov_w]
-                    if x_lat_end < W_lat_total:  # Not right edge
-                        weight_w[-ov_w:] = 1 - ramp_cache['w'][:ov_w]
+                # Faded masks, only on interior edges (avoid fading on outer image borders)
+                weight_h = _tile_blend_weights(weight_cache['h'], eff_h_lat, latent_overlap_h, ramp_cache.get('h'),
+                                               y_lat > 0, y_lat_end < H_lat_total, encoded_tile)
+                weight_w = _tile_blend_weights(weight_cache['w'], eff_w_lat, latent_overlap_w, ramp_cache.get('w'),
+                                               x_lat > 0, x_lat_end < W_lat_total, encoded_tile)
 
                 # Separable application (no 2D mask to save memory)
                 weight_h_5d = weight_h.view(1, 1, 1, eff_h_lat, 1)
                 weight_w_5d = weight_w.view(1, 1, 1, 1, eff_w_lat)
                 encoded_tile.mul_(weight_h_5d).mul_(weight_w_5d)
 
+                count[:, :, :, y_lat : y_lat + eff_h_lat, x_lat : x_lat + eff_w_lat].addcmul_(weight_h_5d, weight_w_5d)
+
                 # Accumulate (move to result device if different)
                 if result.device != encoded_tile.device:
                     encoded_tile = encoded_tile.to(result.device)
-                    weight_h_5d = weight_h_5d.to(result.device)
-                    weight_w_5d = weight_w_5d.to(result.device)
-                
                 result[:, :, : encoded_tile.shape[2], y_lat : y_lat + eff_h_lat, x_lat : x_lat + eff_w_lat] += encoded_tile
-                count[:, :, :, y_lat : y_lat + eff_h_lat, x_lat : x_lat + eff_w_lat].addcmul_(weight_h_5d, weight_w_5d)
 
         # Move result back to inference device if needed and normalize
         if result.device != x.device:
             result = result.to(x.device)
-            count = count.to(x.device)
-        result.div_(count.clamp(min=1e-6))
+        result.div_(count.to(result.device).clamp(min=1e-6))
 
         if x.shape[2] == 1:  # single frame
             result = result.squeeze(2)
@@ -1503,8 +1542,9 @@ class VideoAutoencoderKL(diffusers.AutoencoderKL):
         result = None
         count = None
 
-        num_tiles = ((max(H - latent_overlap_h, 1) + stride_h - 1) // stride_h) \
-                  * ((max(W - latent_overlap_w, 1) + stride_w - 1) // stride_w)
+        y_spans = _tile_spans(H, latent_tile_h, stride_h, latent_overlap_h)
+        x_spans = _tile_spans(W, latent_tile_w, stride_w, latent_overlap_w)
+        num_tiles = len(y_spans) * len(x_spans)
 
         # Log once at start instead of per-tile
         if self.debug:
@@ -1521,18 +1561,17 @@ class VideoAutoencoderKL(diffusers.AutoencoderKL):
         if overlap_w > 0:
             t_w = torch.linspace(0, 1, steps=overlap_w, device=z.device, dtype=z.dtype)
             ramp_cache['w'] = 0.5 - 0.5 * torch.cos(t_w * torch.pi)
+        weight_cache = {'h': {}, 'w': {}}
 
-        tile_id = 0
-        for y_lat in range(0, H, stride_h):
-            y_lat_end = min(y_lat + latent_tile_h, H)
-            for x_lat in range(0, W, stride_w):
-                x_lat_end = min(x_lat + latent_tile_w, W)
+        # CUDA tile copied to the CPU accumulator but not yet added: (tile, copy_done, y_out, x_out)
+        pending = None
 
-                # Skip if fully within overlap of previous tiles
-                if (y_lat > 0 and (y_lat_end - y_lat) <= latent_overlap_h) or \
-                   (x_lat > 0 and (x_lat_end - x_lat) <= latent_overlap_w):
-                    continue
+        def accumulate(tile, y_out, x_out):
+            result[:, :, : tile.shape[2], y_out:y_out + tile.shape[3], x_out:x_out + tile.shape[4]] += tile
 
+        tile_id = 0
+        for y_lat, y_lat_end in y_spans:
+            for x_lat, x_lat_end in x_spans:
                 tile_id += 1
                 
                 # Store tile boundary info for debug visualization
@@ -1576,7 +1615,8 @@ class VideoAutoencoderKL(diffusers.AutoencoderKL):
                         device = decoded_tile.device
                     
                     result = torch.zeros((b_out, c_out, out_f_tile, output_h, output_w), device=device, dtype=decoded_tile.dtype)
-                    count = torch.zeros((1, 1, 1, output_h, output_w), device=device, dtype=decoded_tile.dtype)
+                    # Blend weights are tiny: keep them with the tiles so per-tile masks never cross devices
+                    count = torch.zeros((1, 1, 1, output_h, output_w), device=decoded_tile.device, dtype=decoded_tile.dtype)
 
                 # Corresponding output-space placement
                 y_out, y_out_end = y_lat * scale_factor, y_lat_end * scale_factor
@@ -1585,44 +1625,44 @@ class VideoAutoencoderKL(diffusers.AutoencoderKL):
                 h_out = y_out_end - y_out
                 w_out = x_out_end - x_out
 
-                # Build faded masks
-                ov_h_out = max(0, min(overlap_h, h_out - 1))
-                ov_w_out = max(0, min(overlap_w, w_out - 1))
-                
-                weight_h = torch.ones((h_out,), device=decoded_tile.device, dtype=decoded_tile.dtype)
-                weight_w = torch.ones((w_out,), device=decoded_tile.device, dtype=decoded_tile.dtype)
-
-                # Apply fades only on interior edges using cached ramps (avoid fading on outer image borders)
-                if ov_h_out > 0:
-                    if y_lat > 0:  # Not top edge
-                        weight_h[:ov_h_out] = ramp_cache['h'][:ov_h_out]
-                    if y_lat_end < H:  # Not bottom edge
-                        weight_h[-ov_h_out:] = 1 - ramp_cache['h'][:ov_h_out]
-                if ov_w_out > 0:
-                    if x_lat > 0:  # Not left edge
-                        weight_w[:ov_w_out] = ramp_cache['w'][:ov_w_out]
-                    if x_lat_end < W:  # Not right edge
-                        weight_w[-ov_w_out:] = 1 - ramp_cache['w'][:ov_w_out]
+                # Faded masks, only on interior edges (avoid fading on outer image borders)
+                weight_h = _tile_blend_weights(weight_cache['h'], h_out, overlap_h, ramp_cache.get('h'),
+                                               y_lat > 0, y_lat_end < H, decoded_tile)
+                weight_w = _tile_blend_weights(weight_cache['w'], w_out, overlap_w, ramp_cache.get('w'),
+                                               x_lat > 0, x_lat_end < W, decoded_tile)
 
                 # Separable application (no 2D mask to save memory)
                 weight_h_5d = weight_h.view(1, 1, 1, h_out, 1)
                 weight_w_5d = weight_w.view(1, 1, 1, 1, w_out)
                 decoded_tile.mul_(weight_h_5d).mul_(weight_w_5d)
 
-                # Accumulate (move to result device if different)
-                if result.device != decoded_tile.device:
-                    decoded_tile = decoded_tile.to(result.device)
-                    weight_h_5d = weight_h_5d.to(result.device)
-                    weight_w_5d = weight_w_5d.to(result.device)
-                
-                result[:, :, : decoded_tile.shape[2], y_out:y_out_end, x_out:x_out_end] += decoded_tile
                 count[:, :, :, y_out:y_out_end, x_out:x_out_end].addcmul_(weight_h_5d, weight_w_5d)
 
+                # Accumulate (move to result device if different)
+                if decoded_tile.is_cuda and result.device.type == 'cpu':
+                    # Non-blocking D2H lands in pinned memory. The previous tile is added on
+                    # the CPU while this tile's decode and copy are still running on the GPU
+                    tile_host = decoded_tile.to(result.device, non_blocking=True)
+                    copy_done = torch.cuda.Event()
+                    copy_done.record(torch.cuda.current_stream(decoded_tile.device))
+                    if pending is not None:
+                        pending[1].synchronize()
+                        accumulate(pending[0], pending[2], pending[3])
+                    pending = (tile_host, copy_done, y_out, x_out)
+                else:
+                    if result.device != decoded_tile.device:
+                        decoded_tile = decoded_tile.to(result.device)
+                    accumulate(decoded_tile, y_out, x_out)
+
+        if pending is not None:
+            pending[1].synchronize()
+            accumulate(pending[0], pending[2], pending[3])
+            pending = None
+
         # Move result back to inference device if needed and normalize
         if result.device != z.device:
             result = result.to(z.device)
-            count = count.to(z.device)
-        result.div_(count.clamp(min=1e-6)) # In-place normalize
+        result.div_(count.to(result.device).clamp(min=1e-6)) # In-place normalize
 
         if z.shape[2] == 1:  # single frame
             result = result.squeeze(2)
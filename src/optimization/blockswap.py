@@ -18,8 +18,8 @@ import torch
 import weakref
 
 from typing import Dict, Any, List, Optional
-from .memory_manager import clear_memory
 from .compatibility import call_rope_with_stability
+from .memory_manager import get_rope_modules
 from ..common.distributed import get_device
 
 
@@ -494,7 +494,7 @@ def _wrap_block_forward(
             return original_forward(*args, **kwargs)
 
         # Check if block swap is active for this block
-        if hasattr(model, 'blocks_to_swap') and self._block_idx <= model.blocks_to_swap:
+        if self._block_idx <= getattr(model, 'blocks_to_swap', -1):
             # Use dynamo-disabled helper to get start time (avoids compilation warnings)
             t_start = _get_swap_start_time(debug, debug.enabled if debug else False)
 
@@ -514,8 +514,8 @@ def _wrap_block_forward(
             # Use dynamo-disabled helper to log timing (avoids compilation warnings)
             _log_swap_timing(debug, t_start, self._block_idx, "block")
 
-            # Only clear cache under memory pressure
-            clear_memory(debug=debug, deep=False, force=False, timer_name="wrap_block_forward")
+            # No cache clearing here: the next swapped block reuses the memory this
+            # block just released, and the allocator frees cached blocks itself on OOM
         else:
             output = original_forward(*args, **kwargs)
 
@@ -527,6 +527,12 @@ def _wrap_block_forward(
     # Store reference to original forward for cleanup
     block._original_forward = original_forward
 
+    # Register wrapped block so cleanup only visits blocks that were actually wrapped
+    wrapped_blocks = getattr(model, '_blockswap_wrapped_blocks', None)
+    if wrapped_blocks is None:
+        wrapped_blocks = model._blockswap_wrapped_blocks = []
+    wrapped_blocks.append(block)
+
 
 def _wrap_io_forward(
     module: torch.nn.Module,
@@ -593,9 +599,6 @@ def _wrap_io_forward(
         # Use dynamo-disabled helper to log timing (avoids compilation warnings)
         _log_swap_timing(debug, t_start, self._module_name, "I/O")
 
-        # Only clear cache under memory pressure
-        clear_memory(debug=debug, deep=False, force=False, timer_name="wrap_block_forward")
-
         return output
     
     # Bind as a method
@@ -625,8 +628,8 @@ def _patch_rope_for_blockswap(
     """
     rope_patches = []
     
-    for name, module in model.named_modules():
-        if "rope" in name.lower() and hasattr(module, "get_axial_freqs"):
+    for name, module in get_rope_modules(model):
+        if "rope" in name.lower():
             # Skip if already wrapped by blockswap
             if hasattr(module, '_blockswap_wrapped') and module._blockswap_wrapped:
                 continue
@@ -863,22 +866,16 @@ def cleanup_blockswap(runner, keep_state_for_cache=False):
     if hasattr(model, "dit_model"):
         model = model.dit_model
 
-    # 1. Restore block forward methods
-    if hasattr(model, 'blocks'):
-        restored_count = 0
-        for block in model.blocks:
-            if hasattr(block, '_original_forward'):
-                block.forward = block._original_forward
-                delattr(block, '_original_forward')
-                restored_count += 1
-                
-                # Clean up wrapper attributes
-                for attr in ['_block_idx', '_model_ref', '_debug_ref', '_blockswap_wrapped']:
-                    if hasattr(block, attr):
-                        delattr(block, attr)
-        
-        if restored_count > 0:
-            debug.log(f"Restored {restored_count} block forward methods", category="success")
+    # 1. Restore block forward methods (registered by _wrap_block_forward)
+    wrapped_blocks = getattr(model, '_blockswap_wrapped_blocks', None)
+    if wrapped_blocks:
+        for block in wrapped_blocks:
+            block.forward = block._original_forward
+            del block._original_forward
+            del block._block_idx
+        debug.log(f"Restored {len(wrapped_blocks)} block forward methods", category="success")
+    if wrapped_blocks is not None:
+        del model._blockswap_wrapped_blocks
 
     # 2. Restore RoPE patches
     if hasattr(model, '_rope_patches'):
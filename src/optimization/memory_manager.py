@@ -6,9 +6,11 @@ Extracted from: seedvr2.py (lines 373-405, 607-626, 1016-1044)
 """
 
 import torch
+import atexit
+import functools
 import gc
+import os
 import sys
-import time
 import psutil
 import platform
 from typing import Tuple, Dict, Any, Optional, List, Union
@@ -20,11 +22,14 @@ def _device_str(device: Union[torch.device, str]) -> str:
     return 'MPS' if s.startswith('MPS') else s
 
 
+# Backend availability is fixed for the process lifetime - query the driver once
+@functools.lru_cache(maxsize=None)
 def is_mps_available() -> bool:
     """Check if MPS (Apple Metal) backend is available."""
     return hasattr(torch.backends, 'mps') and torch.backends.mps.is_available()
 
 
+@functools.lru_cache(maxsize=None)
 def is_cuda_available() -> bool:
     """Check if CUDA backend is available."""
     return torch.cuda.is_available()
@@ -129,13 +134,54 @@ def get_basic_vram_info(device: Optional[torch.device] = None) -> Dict[str, Any]
         return {"error": f"Failed to get memory info: {str(e)}"}
 
 
-# Initial VRAM check at module load
-vram_info = get_basic_vram_info(device=None)
-if "error" not in vram_info:
-    backend = "MPS" if is_mps_available() else "CUDA"
-    print(f"📊 Initial {backend} memory: {vram_info['free_gb']:.2f}GB free / {vram_info['total_gb']:.2f}GB total")
-else:
-    print(f"⚠️ Memory check failed: {vram_info['error']} - No available backend!")
+def log_startup_vram() -> None:
+    """
+    Print the initial VRAM state once, from the application entrypoint.
+    Kept out of module import so importing this module never initializes a GPU backend.
+    """
+    vram_info = get_basic_vram_info(device=None)
+    if "error" not in vram_info:
+        backend = "MPS" if is_mps_available() else "CUDA"
+        print(f"📊 Initial {backend} memory: {vram_info['free_gb']:.2f}GB free / {vram_info['total_gb']:.2f}GB total")
+    else:
+        print(f"⚠️ Memory check failed: {vram_info['error']} - No available backend!")
+
+
+def enable_memory_history(snapshot_path: str = "seedvr2_memory_snapshot.pickle") -> bool:
+    """
+    Opt-in CUDA allocator history recording, enabled with SEEDVR2_MEM_TRACE=1.
+    The snapshot is written at exit and can be loaded in pytorch.org/memory_viz.
+    Requires the native allocator: the CLI skips its cudaMallocAsync default when
+    SEEDVR2_MEM_TRACE is set, and an explicit cudaMallocAsync backend is reported.
+    
+    Args:
+        snapshot_path: Output file for the pickled memory snapshot
+        
+    Returns:
+        True if recording was enabled
+    """
+    if os.environ.get("SEEDVR2_MEM_TRACE") != "1" or not is_cuda_available():
+        return False
+    get_backend = getattr(torch.cuda, "get_allocator_backend", None)
+    if get_backend is not None and get_backend() == "cudaMallocAsync":
+        print("⚠️ SEEDVR2_MEM_TRACE: memory history is not supported by the cudaMallocAsync allocator. "
+              "Set PYTORCH_CUDA_ALLOC_CONF to a value without 'backend:cudaMallocAsync' to enable it.")
+        return False
+    try:
+        torch.cuda.memory._record_memory_history(max_entries=100000)
+    except Exception as e:
+        print(f"⚠️ SEEDVR2_MEM_TRACE: memory history unavailable: {e}")
+        return False
+    
+    def _dump_snapshot() -> None:
+        try:
+            torch.cuda.memory._dump_snapshot(snapshot_path)
+            print(f"📊 Memory snapshot written to {snapshot_path}")
+        except Exception as e:
+            print(f"⚠️ SEEDVR2_MEM_TRACE: failed to write snapshot: {e}")
+    
+    atexit.register(_dump_snapshot)
+    return True
 
 
 def get_vram_usage(device: Optional[torch.device] = None, debug: Optional['Debug'] = None) -> Tuple[float, float, float, float]:
@@ -157,10 +203,13 @@ def get_vram_usage(device: Optional[torch.device] = None, debug: Optional['Debug
                 device = torch.device("cuda:0")
             elif not isinstance(device, torch.device):
                 device = torch.device(device)
-            allocated = torch.cuda.memory_allocated(device) / (1024**3)
-            reserved = torch.cuda.memory_reserved(device) / (1024**3)
-            peak_allocated = torch.cuda.max_memory_allocated(device) / (1024**3)
-            peak_reserved = torch.cuda.max_memory_reserved(device) / (1024**3)
+            # One allocator snapshot instead of four (each memory_allocated/reserved
+            # helper builds the full memory_stats dict internally)
+            stats = torch.cuda.memory_stats(device)
+            allocated = stats.get("allocated_bytes.all.current", 0) / (1024**3)
+            reserved = stats.get("reserved_bytes.all.current", 0) / (1024**3)
+            peak_allocated = stats.get("allocated_bytes.all.peak", 0) / (1024**3)
+            peak_reserved = stats.get("reserved_bytes.all.peak", 0) / (1024**3)
             return allocated, reserved, peak_allocated, peak_reserved
         elif is_mps_available():
             # MPS doesn't support per-device queries - uses global memory tracking
@@ -383,11 +432,10 @@ def retry_on_oom(func, *args, debug=None, operation_name="operation", **kwargs):
             debug.log(f"OOM during {operation_name}: {e}", level="WARNING", category="memory", force=True)
             debug.log(f"Clearing memory and retrying", category="info", force=True)
         
-        # Clear memory
+        # Clear memory (empty_cache returns freed blocks synchronously - no settle delay needed)
         clear_memory(debug=debug, deep=True, force=True, timer_name=operation_name)
-        # Let memory settle
-        time.sleep(0.5)
-        debug.log_memory_state("After memory clearing", show_tensors=False, detailed_tensors=False)
+        if debug:
+            debug.log_memory_state("After memory clearing", show_tensors=False, detailed_tensors=False)
         
         # Single retry
         try:
@@ -424,6 +472,29 @@ def reset_vram_peak(device: Optional[torch.device] = None, debug: Optional['Debu
             debug.log(f"Failed to reset peak memory stats: {e}", level="WARNING", category="memory", force=True)
 
 
+def get_rope_modules(model: torch.nn.Module) -> Tuple[Tuple[str, torch.nn.Module], ...]:
+    """
+    Get (name, module) pairs of all RoPE modules (those exposing get_axial_freqs).
+    
+    The full named_modules() walk runs once per model; the result is memoized on the
+    model itself, so a different (reloaded) model is re-indexed automatically.
+    
+    Args:
+        model: PyTorch model to search
+        
+    Returns:
+        Tuple of (qualified name, module) pairs
+    """
+    rope_modules = getattr(model, '_rope_modules', None)
+    if rope_modules is None:
+        rope_modules = tuple(
+            (name, module) for name, module in model.named_modules()
+            if hasattr(module, 'get_axial_freqs')
+        )
+        model._rope_modules = rope_modules
+    return rope_modules
+
+
 def clear_rope_lru_caches(model: Optional[torch.nn.Module], debug: Optional['Debug'] = None) -> int:
     """
     Clear ALL LRU caches from RoPE modules.
@@ -440,8 +511,8 @@ def clear_rope_lru_caches(model: Optional[torch.nn.Module], debug: Optional['Deb
     
     cleared_count = 0
     try:
-        for name, module in model.named_modules():
-            if hasattr(module, 'get_axial_freqs') and hasattr(module.get_axial_freqs, 'cache_clear'):
+        for name, module in get_rope_modules(model):
+            if hasattr(module.get_axial_freqs, 'cache_clear'):
                 try:
                     module.get_axial_freqs.cache_clear()
                     cleared_count += 1
@@ -460,7 +531,12 @@ def release_tensor_memory(tensor: Optional[torch.Tensor]) -> None:
     if tensor is not None and torch.is_tensor(tensor):
         # Release storage for all devices (CPU, CUDA, MPS)
         if tensor.numel() > 0:
-            tensor.data.set_()
+            # Inference tensors can only be modified in-place inside inference mode
+            if tensor.is_inference():
+                with torch.inference_mode():
+                    tensor.data.set_()
+            else:
+                tensor.data.set_()
         tensor.grad = None
 
 
@@ -563,15 +639,14 @@ def release_model_memory(model: Optional[torch.nn.Module], debug: Optional['Debu
         for param in model.parameters():
             if param.is_cuda or param.is_mps:
                 if param.numel() > 0:
-                    param.data.set_()
                     released_params += 1
-                param.grad = None
+                release_tensor_memory(param)
                 
         for buffer in model.buffers():
             if buffer.is_cuda or buffer.is_mps:
                 if buffer.numel() > 0:
-                    buffer.data.set_()
                     released_buffers += 1
+                release_tensor_memory(buffer)
         
         if debug and (released_params > 0 or released_buffers > 0):
             debug.log(f"Released memory from {released_params} params and {released_buffers} buffers", category="success")
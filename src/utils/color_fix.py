@@ -173,17 +173,30 @@ def wavelet_decomposition(image: Tensor, levels: int = 5) -> tuple[Tensor, Tenso
         - high_freq: Detail information [B, C, H, W]
         - low_freq: Color/illumination information [B, C, H, W]
     """
-    high_freq = torch.zeros_like(image)
+    low_freq = wavelet_low_frequency(image, levels)
     
-    for i in range(levels):
-        radius = 2 ** i
-        low_freq = wavelet_blur(image, radius)
-        high_freq.add_(image).sub_(low_freq)
-        image = low_freq
+    # Per-level details (image_i - low_i) telescope to image - low_final
+    high_freq = image - low_freq
     
     return high_freq, low_freq
 
 
+def wavelet_low_frequency(image: Tensor, levels: int = 5) -> Tensor:
+    """
+    Low-frequency component of the wavelet decomposition only.
+    
+    Args:
+        image: Input tensor [B, C, H, W]
+        levels: Number of decomposition levels (default: 5)
+        
+    Returns:
+        Low-frequency (color/illumination) tensor [B, C, H, W]
+    """
+    for i in range(levels):
+        image = wavelet_blur(image, 2 ** i)
+    return image
+
+
 def wavelet_reconstruction(content_feat: Tensor, style_feat: Tensor, debug: Optional['Debug'] = None) -> Tensor:
     """
     Apply wavelet-based color transfer from style to content.
@@ -220,12 +233,11 @@ def wavelet_reconstruction(content_feat: Tensor, style_feat: Tensor, debug: Opti
             )
             debug.log(f"Style resized to: {style_feat.shape}", category="precision", force=True)
     
-    # Decompose both features into frequency components
+    # Decompose content into frequency components; only the style's low frequencies are needed
     content_high_freq, content_low_freq = wavelet_decomposition(content_feat)
     del content_low_freq  # Free memory immediately
     
-    style_high_freq, style_low_freq = wavelet_decomposition(style_feat)  
-    del style_high_freq  # Free memory immediately
+    style_low_freq = wavelet_low_frequency(style_feat)
     
     # Safety check (should not happen after resize)
     if content_high_freq.shape != style_low_freq.shape:
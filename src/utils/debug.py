@@ -92,7 +92,7 @@ class Debug:
         self.timer_hierarchy: Dict[str, List[str]] = {}
         self.timer_durations: Dict[str, float] = {}
         self.timer_messages: Dict[str, str] = {} 
-        self.swap_times: List[Dict[str, Any]] = []
+        self.swap_stats: Dict[str, Any] = self._empty_swap_stats()
         self.current_phase: Optional[str] = None
         self.vram_history: List[float] = []
         self.active_timer_stack: List[str] = [] 
@@ -721,12 +721,19 @@ class Debug:
             force: If True, always log regardless of enabled state
         """
         if self.enabled or force:
-            # Store timing data
-            self.swap_times.append({
-                'component_id': component_id,
-                'component_type': component_type,
-                'duration': duration,
-            })
+            # Accumulate running statistics (no per-swap history is kept)
+            stats = self.swap_stats
+            stats['total_swaps'] += 1
+            if component_type == "block":
+                stats['block_count'] += 1
+                stats['block_sum'] += duration
+                stats['block_min'] = min(stats['block_min'], duration)
+                stats['block_max'] = max(stats['block_max'], duration)
+                stats['block_frequency'][component_id] = stats['block_frequency'].get(component_id, 0) + 1
+            else:
+                stats['io_count'] += 1
+                stats['io_sum'] += duration
+                stats['io_components'][component_id] = None
             
             # Format message based on component type
             if component_type == "block":
@@ -736,45 +743,48 @@ class Debug:
             
             self.log(message, category="blockswap", force=force)
     
+    @staticmethod
+    def _empty_swap_stats() -> Dict[str, Any]:
+        """Create empty running statistics for BlockSwap timing"""
+        return {
+            'total_swaps': 0,
+            'block_count': 0,
+            'block_sum': 0.0,
+            'block_min': float('inf'),
+            'block_max': 0.0,
+            'block_frequency': {},
+            'io_count': 0,
+            'io_sum': 0.0,
+            'io_components': {},
+        }
+    
     def get_swap_summary(self) -> Dict[str, Any]:
         """Get summary of swap operations for analysis"""
-        if not self.swap_times:
+        stats = self.swap_stats
+        if not stats['total_swaps']:
             return {}
         
-        # Group by component type
-        block_swaps = [s for s in self.swap_times if s['component_type'] == 'block']
-        io_swaps = [s for s in self.swap_times if s['component_type'] != 'block']
-        
-        # Calculate statistics
         summary = {
-            'total_swaps': len(self.swap_times),
-            'block_swaps': len(block_swaps),
-            'io_swaps': len(io_swaps),
+            'total_swaps': stats['total_swaps'],
+            'block_swaps': stats['block_count'],
+            'io_swaps': stats['io_count'],
         }
         
-        if block_swaps:
-            block_times = [s['duration'] for s in block_swaps]
-            summary['block_avg_ms'] = sum(block_times) * 1000 / len(block_times)
-            summary['block_total_ms'] = sum(block_times) * 1000
-            summary['block_min_ms'] = min(block_times) * 1000
-            summary['block_max_ms'] = max(block_times) * 1000
+        if stats['block_count']:
+            summary['block_avg_ms'] = stats['block_sum'] * 1000 / stats['block_count']
+            summary['block_total_ms'] = stats['block_sum'] * 1000
+            summary['block_min_ms'] = stats['block_min'] * 1000
+            summary['block_max_ms'] = stats['block_max'] * 1000
             
             # Track which blocks are swapped most frequently
-            block_frequency = {}
-            for swap in block_swaps:
-                block_id = swap['component_id']
-                block_frequency[block_id] = block_frequency.get(block_id, 0) + 1
+            block_frequency = stats['block_frequency']
             summary['most_swapped_block'] = max(block_frequency, key=block_frequency.get)
             summary['most_swapped_count'] = block_frequency[summary['most_swapped_block']]
         
-        if io_swaps:
-            io_times = [s['duration'] for s in io_swaps]
-            summary['io_avg_ms'] = sum(io_times) * 1000 / len(io_times)
-            summary['io_total_ms'] = sum(io_times) * 1000
-            
-            # Track which I/O components are swapped
-            io_components = list(set(s['component_id'] for s in io_swaps))
-            summary['io_components_swapped'] = io_components
+        if stats['io_count']:
+            summary['io_avg_ms'] = stats['io_sum'] * 1000 / stats['io_count']
+            summary['io_total_ms'] = stats['io_sum'] * 1000
+            summary['io_components_swapped'] = list(stats['io_components'])
         
         # VRAM efficiency metrics
         if self.vram_history:
@@ -788,7 +798,7 @@ class Debug:
         """Clear all history tracking"""
         self.timers.clear()
         self.memory_checkpoints.clear()
-        self.swap_times.clear()
+        self.swap_stats = self._empty_swap_stats()
         self.vram_history.clear()
         self.timer_hierarchy.clear()
         self.timer_durations.clear()